@@ -20,19 +20,25 @@ Modify the CONFIGURATION SECTION below to customize:
 - Number of simulations per move
 - Display of detailed analysis
 
+Running without arguments shows an interactive menu. Passing arguments skips
+the prompts, e.g. for scripted benchmarks:
+
+    python run_mcts.py --mode mcts-random --sims 100
+
 The default configuration uses 800 simulations per move (AlphaZero standard)
 with detailed analysis enabled.
 """
 
-# import os
+import argparse
+import itertools
 import random
-# import sys
-from typing import List, Tuple, Optional
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, Union
 
 import chess
-
-# sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
+import chess.polyglot
+import numpy as np
 
 from src.mcts_chess import ChessMCTS
 from src.config import create_custom_config
@@ -43,9 +49,177 @@ from src.config import create_custom_config
 
 # Search parameters
 CUSTOM_SIMULATIONS = 800  # Number of simulations to run per move (AlphaZero standard)
+CUSTOM_WORKERS = 1  # Worker processes for parallel rollouts (1 = serial)
 
 # Display options
 SHOW_DETAILED_ANALYSIS = True  # Show detailed move analysis and principal variation
+SHOW_SEARCH_PROGRESS = True  # Print progress every 100 simulations during search
+
+# Batched search options (used when rollouts run on several workers)
+SEARCH_BATCH_SIZE = 8  # Leaves gathered per virtual-loss selection pass
+
+# Command-line game modes: mode -> (player_type, opponent)
+GAME_MODES = {
+    "human": ("human", "mcts"),
+    "mcts-random": ("mcts", "random"),
+    "mcts-mcts": ("mcts", "mcts"),
+}
+
+# Cache options
+SEARCH_CACHE_SIZE = 256  # Maximum number of searched positions kept in memory
+
+# Search statistics kept per cache entry (the ones a cache hit reports)
+_CACHED_STATS_KEYS = ("simulations_run", "total_time", "selected_move_win_rate")
+
+# Zobrist hash -> (best_move, stats), kept in LRU order. Search trees are not
+# cached: they belong to the engines, which reuse and prune them across moves
+_search_cache: "OrderedDict[int, Tuple[chess.Move, Dict]]" = OrderedDict()
+
+# Initial number of win rate rows preallocated per game (grown when full)
+_WIN_RATE_HISTORY_SIZE = 600
+
+# Game termination lookups, resolved once at import time. The game loop does
+# not claim draws, so only the automatic draws can end a game
+_CHECKMATE = chess.Termination.CHECKMATE
+_DRAW_REASONS = {
+    chess.Termination.STALEMATE: "Stalemate",
+    chess.Termination.INSUFFICIENT_MATERIAL: "Insufficient material",
+    chess.Termination.FIVEFOLD_REPETITION: "Fivefold repetition",
+    chess.Termination.SEVENTYFIVE_MOVES: "Seventy-five-move rule",
+}
+
+
+def cached_search(
+    mcts: ChessMCTS, board: chess.Board, batched: bool = False
+) -> Tuple[chess.Move, Dict]:
+    """
+    Run an MCTS search, reusing a previous result for an identical position.
+
+    Positions are keyed by their Zobrist hash, so transpositions reached through
+    a different move order hit the cache as well. A cached entry is only reused
+    if it was searched with at least ``CUSTOM_SIMULATIONS`` simulations.
+
+    Parameters
+    ----------
+    mcts : ChessMCTS
+        The engine used to search on a cache miss. A cache hit leaves its search
+        tree untouched.
+    board : chess.Board
+        The current chess board position.
+    batched : bool, default=False
+        Use ``ChessMCTS.search_batched`` (virtual-loss leaf batching) on a miss.
+
+    Returns
+    -------
+    tuple of (chess.Move, dict)
+        Best move and search statistics, as returned by ``ChessMCTS.search``.
+        A cache hit only returns the statistics in ``_CACHED_STATS_KEYS``.
+    """
+    key = chess.polyglot.zobrist_hash(board)
+    entry = _search_cache.get(key)
+    if entry is not None and entry[1]["simulations_run"] >= CUSTOM_SIMULATIONS:
+        _search_cache.move_to_end(key)
+        print("Position found in search cache")
+        return entry
+
+    if batched:
+        move, stats = mcts.search_batched(board, vloss=SEARCH_BATCH_SIZE)
+    else:
+        move, stats = mcts.search(board)
+    # Keep only the small statistics a hit reports: the full stats hold a
+    # nested copy of the whole search tree
+    _search_cache[key] = (move, {name: stats[name] for name in _CACHED_STATS_KEYS})
+    _search_cache.move_to_end(key)
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        # Evict the least recently used position
+        _search_cache.popitem(last=False)
+    return move, stats
+
+
+def _looks_like_uci(move_input: str) -> bool:
+    """
+    Check whether the input has the shape of a UCI move (e.g. "e2e4", "h7h8q").
+
+    Parameters
+    ----------
+    move_input : str
+        Raw move text entered by the player.
+
+    Returns
+    -------
+    bool
+        True if the input starts with two file/rank coordinate pairs.
+    """
+    return (
+        len(move_input) in (4, 5)
+        and move_input[0] in "abcdefgh"
+        and move_input[1] in "12345678"
+        and move_input[2] in "abcdefgh"
+        and move_input[3] in "12345678"
+    )
+
+
+def _parse_san_move(board: chess.Board, move_input: str) -> Optional[chess.Move]:
+    """
+    Parse a move in standard algebraic notation, returning None if invalid.
+
+    Parameters
+    ----------
+    board : chess.Board
+        The current chess board position.
+    move_input : str
+        Raw move text entered by the player.
+
+    Returns
+    -------
+    chess.Move or None
+        The legal move, or None if the input is not valid SAN here.
+    """
+    try:
+        return board.parse_san(move_input)
+    except (
+        chess.InvalidMoveError,
+        chess.IllegalMoveError,
+        chess.AmbiguousMoveError,
+    ):
+        return None
+
+
+def _parse_uci_move(board: chess.Board, move_input: str) -> Optional[chess.Move]:
+    """
+    Parse a move in UCI notation, returning None if invalid or illegal.
+
+    Parameters
+    ----------
+    board : chess.Board
+        The current chess board position.
+    move_input : str
+        Raw move text entered by the player.
+
+    Returns
+    -------
+    chess.Move or None
+        The legal move, or None if the input is not a legal UCI move here.
+    """
+    try:
+        move = chess.Move.from_uci(move_input)
+    except (ValueError, chess.InvalidMoveError):
+        return None
+    return move if board.is_legal(move) else None
+
+
+def _close_engines(*engines: Optional[ChessMCTS]) -> None:
+    """
+    Shut down the rollout worker pools of the given engines.
+
+    Parameters
+    ----------
+    *engines : ChessMCTS or None
+        Engines to close; None entries are skipped.
+    """
+    for engine in engines:
+        if engine is not None:
+            engine.close()
 
 
 def get_human_move(board: chess.Board, player_color_name: str) -> Optional[chess.Move]:
@@ -86,49 +260,42 @@ def get_human_move(board: chess.Board, player_color_name: str) -> Optional[chess
     while True:
         try:
             move_input = input(f"Your move ({player_color_name}): ").strip()
+            command = move_input.lower()
 
             # Handle special commands
-            if move_input.lower() in ["quit", "exit"]:
+            if command in ["quit", "exit"]:
                 print("Game ended by player.")
                 return None
 
-            if move_input.lower() == "help":
+            if command == "help":
                 print("\nMove format examples:")
                 print("  Standard: e4, Nf3, Bxf7+, O-O, Qh5#")
                 print("  UCI: e2e4, g1f3, e1g1, h7h8q (promotion)")
                 print("  Commands: help, moves, quit")
                 continue
 
-            if move_input.lower() == "moves":
-                legal_moves = list(board.legal_moves)
-                print(f"\nLegal moves ({len(legal_moves)}):")
-                move_strs = [str(move) for move in legal_moves]
+            if command == "moves":
+                move_strs = list(map(str, board.legal_moves))
+                print(f"\nLegal moves ({len(move_strs)}):")
                 # Print in rows of 8
-                for i in range(0, len(move_strs), 8):
-                    print("  " + " ".join(move_strs[i : i + 8]))
+                rows = (
+                    " ".join(move_strs[i : i + 8]) for i in range(0, len(move_strs), 8)
+                )
+                sys.stdout.write("  " + "\n  ".join(rows) + "\n")
                 continue
 
-            # Try to parse the move
-            move = None
+            # Try the notation the input most likely uses first, so UCI input
+            # does not pay for a failed SAN parse
+            if _looks_like_uci(move_input):
+                parsers = (_parse_uci_move, _parse_san_move)
+            else:
+                parsers = (_parse_san_move, _parse_uci_move)
 
-            # First try standard algebraic notation
-            try:
-                move = board.parse_san(move_input)
-            except (
-                chess.InvalidMoveError,
-                chess.IllegalMoveError,
-                chess.AmbiguousMoveError,
-            ):
-                pass
-
-            # If that failed, try UCI notation
-            if move is None:
-                try:
-                    move = chess.Move.from_uci(move_input)
-                    if move not in board.legal_moves:
-                        move = None
-                except (ValueError, chess.InvalidMoveError):
-                    pass
+            move = None
+            for parse in parsers:
+                move = parse(board, move_input)
+                if move is not None:
+                    break
 
             if move is None:
                 print(
@@ -148,7 +315,56 @@ def get_human_move(board: chess.Board, player_color_name: str) -> Optional[chess
             continue
 
 
-def display_win_rate_chart(win_rates_history: List[Tuple[float, float]]) -> None:
+def _split_win_rate(turn: chess.Color, win_rate: float) -> Tuple[float, float]:
+    """
+    Convert the side to move's win rate into (white, black) win rates.
+
+    Parameters
+    ----------
+    turn : chess.Color
+        The side to move (True for White, False for Black).
+    win_rate : float
+        Win rate from the side to move's perspective, between 0.0 and 1.0.
+
+    Returns
+    -------
+    tuple of (float, float)
+        The (white_win_rate, black_win_rate) pair.
+    """
+    return (win_rate, 1.0 - win_rate) if turn else (1.0 - win_rate, win_rate)
+
+
+def _store_win_rate(
+    history: np.ndarray, index: int, white_win_rate: float, black_win_rate: float
+) -> np.ndarray:
+    """
+    Write a (white, black) win rate row into a preallocated history array.
+
+    Parameters
+    ----------
+    history : numpy.ndarray
+        Array of shape (capacity, 2) holding the recorded win rates.
+    index : int
+        Row to write, i.e. the number of rows recorded so far.
+    white_win_rate : float
+        White's win rate for this round.
+    black_win_rate : float
+        Black's win rate for this round.
+
+    Returns
+    -------
+    numpy.ndarray
+        The history array, reallocated with double capacity if it was full.
+    """
+    if index == len(history):
+        history = np.concatenate([history, np.zeros_like(history)])
+    history[index] = (white_win_rate, black_win_rate)
+    return history
+
+
+def display_win_rate_chart(
+    win_rates_history: Union[np.ndarray, List[Tuple[float, float]]],
+) -> None:
     """
     Display a simple text chart showing win rate evolution by round.
 
@@ -157,8 +373,9 @@ def display_win_rate_chart(win_rates_history: List[Tuple[float, float]]) -> None
 
     Parameters
     ----------
-    win_rates_history : list of tuple
-        List of (white_win_rate, black_win_rate) tuples for each round.
+    win_rates_history : numpy.ndarray or list of tuple
+        Array of shape (rounds, 2), or list of tuples, holding the
+        (white_win_rate, black_win_rate) pair for each round.
         Each win rate should be a float between 0.0 and 1.0.
 
     Notes
@@ -168,38 +385,44 @@ def display_win_rate_chart(win_rates_history: List[Tuple[float, float]]) -> None
     - 'B': Black advantage regions
     - ' ': Draw tendency regions
     """
-    if not win_rates_history:
+    if len(win_rates_history) == 0:
         return
 
-    print("\n" + "=" * 60)
-    print("WIN RATE EVOLUTION CHART")
-    print("=" * 60)
-    print("Round | White Win % | Black Win % | Chart (W=White, B=Black)")
-    print("-" * 60)
-
-    for round_num, (white_rate, black_rate) in enumerate(win_rates_history, 1):
-        # Create a simple bar chart (50 characters wide)
-        chart_width = 50
-        white_bars = int(white_rate * chart_width)
-        black_bars = int(black_rate * chart_width)
-
+    lines = [
+        "",
+        "=" * 60,
+        "WIN RATE EVOLUTION CHART",
+        "=" * 60,
+        "Round | White Win % | Black Win % | Chart (W=White, B=Black)",
+        "-" * 60,
+    ]
+
+    # Create a simple bar chart (50 characters wide)
+    chart_width = 50
+    rates = np.asarray(win_rates_history, dtype=np.float64).reshape(-1, 2)
+    # Truncate all rates to bar counts in one vectorized pass
+    bars = (rates * chart_width).astype(np.int64)
+
+    for round_num, ((white_rate, black_rate), (white_bars, black_bars)) in enumerate(
+        zip(rates.tolist(), bars.tolist()), 1
+    ):
         # Build the chart string
-        chart = ""
-        for i in range(chart_width):
-            if i < white_bars:
-                chart += "W"
-            elif i < white_bars + black_bars:
-                chart += "B"
-            else:
-                chart += " "
+        chart = (
+            "W" * white_bars
+            + "B" * black_bars
+            + " " * (chart_width - white_bars - black_bars)
+        )
 
-        print(
+        lines.append(
             f"{round_num:5d} | {white_rate * 100:10.1f} | {black_rate * 100:10.1f} | {chart}"
         )
 
-    print("-" * 60)
-    print("W = White advantage, B = Black advantage, Space = Draw tendency")
-    print("=" * 60)
+    lines.append("-" * 60)
+    lines.append("W = White advantage, B = Black advantage, Space = Draw tendency")
+    lines.append("=" * 60)
+
+    # Emit the whole chart with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def interactive_play(
@@ -276,7 +499,9 @@ def interactive_play(
     print()
 
     # Get MCTS configuration
-    mcts_config = create_custom_config(CUSTOM_SIMULATIONS)
+    mcts_config = create_custom_config(
+        CUSTOM_SIMULATIONS, CUSTOM_WORKERS, SHOW_SEARCH_PROGRESS
+    )
 
     # Setup MCTS engines based on player and opponent types
     player_mcts = None
@@ -285,134 +510,164 @@ def interactive_play(
     if not is_human_player:
         # Player uses MCTS
         player_mcts = ChessMCTS(mcts_config)
-        print(f"Player MCTS Config: Sims={mcts_config.num_simulations}")
+        print(f"Player {player_mcts.describe()}")
 
     if opponent_type == "mcts":
         # Opponent uses MCTS
         opponent_mcts = ChessMCTS(mcts_config)
-        print(f"Opponent MCTS Config: Sims={mcts_config.num_simulations}")
-    print()
-
-    # Create chess board
-    board = chess.Board()
-    move_count = 0
-
-    # Win rate tracking
-    win_rates_history = []  # Store (white_win_rate, black_win_rate) for each round
-
-    print("Game starting")
+        print(f"Opponent {opponent_mcts.describe()}")
 
-    # Game begins
-    while not board.is_game_over():
-        current_player = "White" if board.turn else "Black"
-        is_player_turn = board.turn == player_color
+    # Parallel rollouts use virtual-loss leaf batching; with a single worker
+    # batching gives no speedup, so the plain search is used
+    use_batched_search = mcts_config.num_workers > 1
+    if use_batched_search:
+        print(f"Batched search: {SEARCH_BATCH_SIZE} leaves per batch")
+    print()
 
-        print(f"\n{'=' * 50}")
-        print(f"MOVE {move_count + 1} - {current_player.upper()} TO MOVE")
-        print(f"{'=' * 50}")
-        print(board)
-        print()
+    # Worker pools must be shut down however the game ends (including errors
+    # and Ctrl+C during a search)
+    try:
+        # Create chess board
+        board = chess.Board()
+        move_count = 0
+
+        # Win rate tracking
+        # Preallocated (white_win_rate, black_win_rate) rows, one per MCTS move
+        win_rates_history = np.zeros((_WIN_RATE_HISTORY_SIZE, 2), dtype=np.float64)
+        num_win_rates = 0
+
+        # Move header separator, built once for the whole game
+        separator = "=" * 50
+
+        print("Game starting")
+
+        # Game begins - the outcome is computed once per ply and reused after the loop
+        while (outcome := board.outcome(claim_draw=False)) is None:
+            current_player = "White" if board.turn else "Black"
+            is_player_turn = board.turn == player_color
+
+            # Emit the move header and board in a single write
+            print(
+                f"\n{separator}\n"
+                f"MOVE {move_count + 1} - {current_player.upper()} TO MOVE\n"
+                f"{separator}\n"
+                f"{board}\n"
+            )
+
+            if is_player_turn:
+                # player's turn - handle human input vs MCTS
+                if is_human_player:
+                    # Human player enters moves
+                    move = get_human_move(board, player_color_name)
+                    if move is None:
+                        return  # Player quit
+                    board.push(move)
+                else:
+                    # MCTS player
+                    print(f"Your turn ({player_color_name}) - MCTS thinking")
+                    move, stats = cached_search(
+                        player_mcts, board, batched=use_batched_search
+                    )
 
-        if is_player_turn:
-            # player's turn - handle human input vs MCTS
-            if is_human_player:
-                # Human player enters moves
-                move = get_human_move(board, player_color_name)
-                if move is None:
-                    return  # Player quit
-                board.push(move)
-            else:
-                # MCTS player
-                print(f"Your turn ({player_color_name}) - MCTS thinking")
-                move, stats = player_mcts.search(board)
-
-                # Use the selected move's win rate from MCTS stats
-                if "selected_move_win_rate" in stats:
-                    current_player_win_rate = stats["selected_move_win_rate"]
-                    # Convert to white/black perspective
-                    if board.turn:  # White to move
-                        white_win_rate = current_player_win_rate
-                        black_win_rate = 1.0 - current_player_win_rate
-                    else:  # Black to move
-                        black_win_rate = current_player_win_rate
-                        white_win_rate = 1.0 - current_player_win_rate
-
-                    win_rates_history.append((white_win_rate, black_win_rate))
+                    # Use the selected move's win rate from MCTS stats
+                    if "selected_move_win_rate" in stats:
+                        current_player_win_rate = stats["selected_move_win_rate"]
+                        # Convert to white/black perspective
+                        white_win_rate, black_win_rate = _split_win_rate(
+                            board.turn, current_player_win_rate
+                        )
+
+                        win_rates_history = _store_win_rate(
+                            win_rates_history,
+                            num_win_rates,
+                            white_win_rate,
+                            black_win_rate,
+                        )
+                        num_win_rates += 1
+                        print(
+                            f"Move win probability: White {white_win_rate * 100:.1f}%, Black {black_win_rate * 100:.1f}%"
+                        )
+
+                    print(f"You (MCTS) play: {move}")
                     print(
-                        f"Move win probability: White {white_win_rate * 100:.1f}%, Black {black_win_rate * 100:.1f}%"
+                        f"Search stats: {stats['simulations_run']} sims in {stats['total_time']:.2f}s"
                     )
 
-                print(f"You (MCTS) play: {move}")
-                print(
-                    f"Search stats: {stats['simulations_run']} sims in {stats['total_time']:.2f}s"
-                )
-
-                if SHOW_DETAILED_ANALYSIS:
-                    player_mcts.print_move_analysis(3)
+                    # On a cache hit the engine's tree may be rooted elsewhere
+                    if SHOW_DETAILED_ANALYSIS and (
+                        player_mcts.root is not None and player_mcts.root.board == board
+                    ):
+                        player_mcts.print_move_analysis(3)
 
-                board.push(move)
-        else:
-            # Opponent's turn
-            if opponent_type == "random":
-                # Random opponent
-                legal_moves = list(board.legal_moves)
-                move = random.choice(legal_moves)
-                print(f"Opponent (Random) plays: {move}")
-                board.push(move)
+                    board.push(move)
             else:
-                # MCTS opponent
-                print("Opponent (MCTS) thinking...")
-                move, stats = opponent_mcts.search(board)
-
-                # Use the selected move's win rate from MCTS stats
-                if "selected_move_win_rate" in stats:
-                    current_player_win_rate = stats["selected_move_win_rate"]
-                    # Convert to white/black perspective
-                    if board.turn == chess.WHITE:  # White to move
-                        white_win_rate = current_player_win_rate
-                        black_win_rate = 1.0 - current_player_win_rate
-                    else:  # Black to move
-                        black_win_rate = current_player_win_rate
-                        white_win_rate = 1.0 - current_player_win_rate
-
-                    win_rates_history.append((white_win_rate, black_win_rate))
-                    print(
-                        f"Move win probability: White {white_win_rate * 100:.1f}%, Black {black_win_rate * 100:.1f}%"
+                # Opponent's turn
+                if opponent_type == "random":
+                    # Random opponent - draw one index and skip to it, which avoids
+                    # materializing the legal move list and one random draw per move
+                    index = random.randrange(board.legal_moves.count())
+                    move = next(
+                        itertools.islice(board.generate_legal_moves(), index, None)
+                    )
+                    print(f"Opponent (Random) plays: {move}")
+                    board.push(move)
+                else:
+                    # MCTS opponent
+                    print("Opponent (MCTS) thinking...")
+                    move, stats = cached_search(
+                        opponent_mcts, board, batched=use_batched_search
                     )
 
-        move_count += 1
-
-        # Check for game end
-        if board.is_game_over():
-            break
-
-        # Pause between moves
-        # input("\nPress Enter to continue...")
-
-    # Game over
-    print(f"\n{'=' * 50}")
-    print("GAME OVER")
-    print(f"{'=' * 50}")
-    print("Final position:")
-    print(board)
-    print()
+                    # Use the selected move's win rate from MCTS stats
+                    if "selected_move_win_rate" in stats:
+                        current_player_win_rate = stats["selected_move_win_rate"]
+                        # Convert to white/black perspective
+                        white_win_rate, black_win_rate = _split_win_rate(
+                            board.turn, current_player_win_rate
+                        )
+
+                        win_rates_history = _store_win_rate(
+                            win_rates_history,
+                            num_win_rates,
+                            white_win_rate,
+                            black_win_rate,
+                        )
+                        num_win_rates += 1
+                        print(
+                            f"Move win probability: White {white_win_rate * 100:.1f}%, Black {black_win_rate * 100:.1f}%"
+                        )
+
+                    print(f"Opponent (MCTS) plays: {move}")
+                    board.push(move)
+
+            # Tree reuse: promote the played move's subtree so the next search starts warm
+            for mcts in (player_mcts, opponent_mcts):
+                if mcts is not None:
+                    mcts.advance_root(move)
+
+            move_count += 1
+
+            # Pause between moves
+            # input("\nPress Enter to continue...")
+
+        # Game over
+        print(f"\n{'=' * 50}")
+        print("GAME OVER")
+        print(f"{'=' * 50}")
+        print("Final position:")
+        print(board)
+        print()
 
-    outcome = board.outcome()
-    if outcome:
+        # The loop only exits once the game has an outcome
         if outcome.winner is None:
             print("Result: DRAW")
-            if outcome.termination == chess.Termination.STALEMATE:
-                print("Reason: Stalemate")
-            elif outcome.termination == chess.Termination.INSUFFICIENT_MATERIAL:
-                print("Reason: Insufficient material")
-            elif outcome.termination == chess.Termination.THREEFOLD_REPETITION:
-                print("Reason: Threefold repetition")
-            elif outcome.termination == chess.Termination.FIFTY_MOVES:
-                print("Reason: Fifty-move rule")
+            reason = _DRAW_REASONS.get(outcome.termination)
+            if reason:
+                print(f"Reason: {reason}")
         else:
             winner = "White" if outcome.winner else "Black"
             print(f"Result: {winner} WINS!")
-            if outcome.termination == chess.Termination.CHECKMATE:
+            if outcome.termination == _CHECKMATE:
                 print("Reason: Checkmate")
 
             # Determine if player won
@@ -421,46 +676,132 @@ def interactive_play(
                 print("\n🎉 You (MCTS) won! 🎉")
             else:
                 print(f"\n😞 You lost to the {opponent_name} opponent!")
-    else:
-        print(f"Game ended after {move_count} moves (move limit reached)")
 
-    # Display win rate evolution chart
-    if win_rates_history:
-        display_win_rate_chart(win_rates_history)
+        # Display win rate evolution chart
+        if num_win_rates:
+            display_win_rate_chart(win_rates_history[:num_win_rates])
 
+    finally:
+        _close_engines(player_mcts, opponent_mcts)
 
-if __name__ == "__main__":
-    print("Chess Monte Carlo Tree Search")
-    print("=" * 40)
-    print()
-    print("Select game mode:")
-    print("1. Human vs Computer (you enter moves)")
-    print("2. MCTS vs Random opponent")
-    print("3. MCTS vs MCTS")
-    print()
 
-    choice = input("Enter your choice (1-3): ").strip()
-    print()
+def _positive_int(value: str) -> int:
+    """
+    Argparse type for strictly positive integer options.
+
+    Parameters
+    ----------
+    value : str
+        The raw command-line value.
+
+    Returns
+    -------
+    int
+        The parsed value.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the value is not an integer greater than zero.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
 
-    if choice == "1":
-        # Human vs Computer mode
-        print("Human vs Computer mode selected")
-        color_choice = input("Play as (w)hite or (b)lack? [w]: ").strip().lower()
-        player_color = "black" if color_choice in ["b", "black"] else "white"
-        interactive_play(
-            player_type="human", player_color=player_color, opponent="mcts"
-        )
 
-    elif choice == "2":
-        # MCTS vs Random mode
-        print("MCTS vs Random mode selected")
-        color_choice = input("MCTS plays as (w)hite or (b)lack? [w]: ").strip().lower()
-        player_color = "black" if color_choice in ["b", "black"] else "white"
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments for scripted (non-interactive) runs.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Arguments to parse. If None, ``sys.argv[1:]`` is used.
+
+    Returns
+    -------
+    argparse.Namespace
+        Parsed arguments with ``mode``, ``color``, ``sims`` and ``workers``
+        attributes.
+    """
+    parser = argparse.ArgumentParser(description="Chess Monte Carlo Tree Search")
+    parser.add_argument(
+        "--mode",
+        choices=sorted(GAME_MODES),
+        default="mcts-random",
+        help="Game mode to play (default: mcts-random)",
+    )
+    parser.add_argument(
+        "--color",
+        choices=["white", "black"],
+        default="white",
+        help="Color of the human/MCTS player (default: white)",
+    )
+    parser.add_argument(
+        "--sims",
+        type=_positive_int,
+        default=None,
+        help=f"Simulations per move (default: {CUSTOM_SIMULATIONS})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help=f"Worker processes for parallel rollouts (default: {CUSTOM_WORKERS})",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Scripted mode: configure the game from the command line, no prompts
+        args = parse_args()
+        if args.sims is not None:
+            CUSTOM_SIMULATIONS = args.sims
+        if args.workers is not None:
+            CUSTOM_WORKERS = args.workers
+        player_type, opponent = GAME_MODES[args.mode]
         interactive_play(
-            player_type="mcts", player_color=player_color, opponent="random"
+            player_type=player_type, player_color=args.color, opponent=opponent
         )
+    else:
+        print("Chess Monte Carlo Tree Search")
+        print("=" * 40)
+        print()
+        print("Select game mode:")
+        print("1. Human vs Computer (you enter moves)")
+        print("2. MCTS vs Random opponent")
+        print("3. MCTS vs MCTS")
+        print()
+
+        choice = input("Enter your choice (1-3): ").strip()
+        print()
 
-    elif choice == "3":
-        # MCTS vs MCTS mode
-        print("MCTS vs MCTS mode selected")
-        interactive_play(player_type="mcts", player_color="white", opponent="mcts")
+        if choice == "1":
+            # Human vs Computer mode
+            print("Human vs Computer mode selected")
+            color_choice = input("Play as (w)hite or (b)lack? [w]: ").strip().lower()
+            player_color = "black" if color_choice in ["b", "black"] else "white"
+            interactive_play(
+                player_type="human", player_color=player_color, opponent="mcts"
+            )
+
+        elif choice == "2":
+            # MCTS vs Random mode
+            print("MCTS vs Random mode selected")
+            color_choice = (
+                input("MCTS plays as (w)hite or (b)lack? [w]: ").strip().lower()
+            )
+            player_color = "black" if color_choice in ["b", "black"] else "white"
+            interactive_play(
+                player_type="mcts", player_color=player_color, opponent="random"
+            )
+
+        elif choice == "3":
+            # MCTS vs MCTS mode
+            print("MCTS vs MCTS mode selected")
+            interactive_play(player_type="mcts", player_color="white", opponent="mcts")
@@ -6,7 +6,7 @@ Monte Carlo Tree Search chess engine. It provides an easy interface for
 adjusting search parameters without modifying the core MCTS implementation.
 
 The module includes:
-- SearchConfig dataclass for parameter specification
+- MCTSConfig dataclass for parameter specification
 - Preset configurations based on research (AlphaZero)
 - Factory functions for creating custom configurations
 - Documentation of parameter effects on search behavior
@@ -31,33 +31,93 @@ but require more time per move.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
+# Smallest allowed max_tree_nodes. Pruning shrinks the tree to 3/4 of the limit
+# but always keeps the root's children (up to 218 legal moves in chess), so a
+# smaller limit could not be met and would flatten the search to depth 1.
+MIN_TREE_NODES = 1000
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MCTSConfig:
     """
     Configuration parameters for MCTS search.
 
+    Instances are immutable (and therefore hashable), so a configuration can
+    be shared between engines or used as a cache key. Use
+    ``dataclasses.replace`` to derive a modified configuration.
+
     Attributes
     ----------
-    max_simulation_depth : int, default=5
+    num_simulations : int, default=800
+        Number of simulations to run per search.
+    max_simulation_depth : int, default=250
         Maximum depth for simulation (number of moves per side).
-    num_simulations : int, default=1000
-        Number of simulations to run for each node.
     exploration_constant : float, default=1.414
         UCB1 exploration parameter (sqrt(2) is theoretical optimum).
+    num_workers : int, default=1
+        Number of worker processes used by ``ChessMCTS.search_batched`` to
+        run rollouts in parallel.
+    use_tt : bool, default=False
+        Share search nodes between move orders that transpose into the same
+        position (transposition table). Statistics are then kept per edge.
+    rollouts_per_leaf : int, default=1
+        Number of random playouts run from each selected leaf. Every playout
+        counts towards ``num_simulations``, so higher values spend fewer
+        tree descents (selection and expansion) on the same playout budget.
+    max_tree_nodes : int or None, default=None
+        Upper bound on the number of nodes kept in the search tree. When a
+        search grows the tree past it, the subtrees of the least visited root
+        moves are pruned. None means no limit; otherwise it must be at least
+        ``MIN_TREE_NODES`` (1000).
+    verbose : bool, default=False
+        Print search progress every 100 simulations.
     """
     # === SEARCH CONTROL ===
 
     # Number of simulations to run (more = better but slower)
     num_simulations: int = 800  # AlphaZero uses 800 simulations per move
 
+    # Maximum number of moves per side in each random playout; playouts that
+    # reach the limit are scored as a draw
+    max_simulation_depth: int = 250
+
     # === ADVANCED PARAMETERS ===
 
     # UCB1 exploration constant (higher = more exploration vs exploitation)
     # 1.414 (sqrt(2)) is the theoretical optimum
     exploration_constant: float = 1.414
 
+    # Number of worker processes for batched rollouts (1 = run serially)
+    num_workers: int = 1
+
+    # Share nodes between move orders that reach the same position
+    use_tt: bool = False
+
+    # Random playouts per selected leaf (each one counts as a simulation)
+    rollouts_per_leaf: int = 1
+
+    # Maximum number of nodes kept in the tree (None = unlimited); bounds the
+    # memory used by long searches and by trees reused across moves
+    max_tree_nodes: Optional[int] = None
+
+    # === OUTPUT ===
+
+    # Print search progress every 100 simulations
+    verbose: bool = False
+
+    def __post_init__(self):
+        if self.max_tree_nodes is not None and (
+            not isinstance(self.max_tree_nodes, int)
+            or self.max_tree_nodes < MIN_TREE_NODES
+        ):
+            raise ValueError(
+                f"max_tree_nodes must be None or an int >= {MIN_TREE_NODES}, "
+                f"got {self.max_tree_nodes!r}"
+            )
+
 
 # AlphaZero search configuration
 # NOTE: "During training, each MCTS used 800 simulations per move" - AlphaZero paper
@@ -66,22 +126,34 @@ ALPHAZERO_CONFIG = MCTSConfig(
 )
 
 
-def create_custom_config(simulations: int = 800) -> MCTSConfig:
+@lru_cache(maxsize=32)
+def create_custom_config(
+    simulations: int = 800, workers: int = 1, verbose: bool = False
+) -> MCTSConfig:
     """
     Create a custom configuration with specified parameters.
 
+    Results are memoized, so repeated calls with the same arguments return
+    the same (shared) configuration instance.
+
     Parameters
     ----------
-    simulations : int, default=1000
+    simulations : int, default=800
         Number of simulations to run per move. Higher values provide
         better move quality but take longer to compute.
+    workers : int, default=1
+        Number of worker processes for parallel rollouts in batched search.
+    verbose : bool, default=False
+        Print search progress every 100 simulations.
 
     Returns
     -------
-    SearchConfig
-        A new SearchConfig instance with the specified simulation count
-        and default values for other parameters.
+    MCTSConfig
+        A configuration with the specified simulation and worker counts and
+        verbosity, and default values for other parameters.
     """
     return MCTSConfig(
         num_simulations=simulations,
+        num_workers=workers,
+        verbose=verbose,
     )
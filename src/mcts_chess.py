@@ -2,15 +2,86 @@
 Monte Carlo Tree Search implementation for chess with configurable depth and breadth parameters.
 """
 
+from __future__ import annotations
+
 import math
 import random
 import time
-from typing import List, Optional, Dict, Tuple
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple
+
+import numpy as np
 
-import chess
+if TYPE_CHECKING:
+    # Only needed for annotations: boards and moves are created by the callers,
+    # so importing this module does not have to load python-chess
+    import chess
 
 from .config import MCTSConfig
 
+# Functions called in the search hot loop, bound once at import time so each
+# call skips the module attribute lookup
+_log = math.log
+_sqrt = math.sqrt
+_randrange = random.randrange
+_shuffle = random.shuffle
+_time = time.time
+
+
+def _random_legal_move(board: chess.Board) -> Optional[chess.Move]:
+    """
+    Draw a uniformly random legal move using pseudo-legal rejection sampling.
+
+    Generating pseudo-legal moves skips the king-safety check that full legal
+    move generation runs for every move; instead only the sampled move is
+    checked. Rejected moves are removed, so the result is uniform over the
+    legal moves.
+
+    Parameters
+    ----------
+    board : chess.Board
+        The position to draw a move from.
+
+    Returns
+    -------
+    chess.Move or None
+        A random legal move, or None if there are no legal moves (checkmate
+        or stalemate).
+    """
+    moves = list(board.generate_pseudo_legal_moves())
+    while moves:
+        index = _randrange(len(moves))
+        move = moves[index]
+        if not board.is_into_check(move):
+            return move
+        # Swap-remove the illegal move and draw again
+        moves[index] = moves[-1]
+        moves.pop()
+    return None
+
+
+def _transposition_key(board: chess.Board) -> Tuple:
+    """
+    Key identifying a position for the transposition table.
+
+    The halfmove clock is part of the key: reversible moves always increase it
+    and irreversible moves (captures, pawn moves) can never be undone, so no
+    position can transpose into one of its own ancestors. This keeps the
+    shared search graph acyclic.
+
+    Parameters
+    ----------
+    board : chess.Board
+        The position to key.
+
+    Returns
+    -------
+    tuple
+        Hashable key for the position.
+    """
+    return board._transposition_key(), board.halfmove_clock
+
 
 class MCTSNode:
     """
@@ -19,7 +90,8 @@ class MCTSNode:
     Parameters
     ----------
     board : chess.Board
-        The chess position at this node.
+        The chess position at this node. The node takes ownership of the board,
+        so callers must pass a board they will not modify afterwards.
     move : chess.Move, optional
         The move that led to this position.
     parent : MCTSNode, optional
@@ -28,42 +100,127 @@ class MCTSNode:
     Attributes
     ----------
     board : chess.Board
-        Copy of the chess position.
+        The chess position (owned by this node).
     move : chess.Move or None
         The move that led to this position.
     parent : MCTSNode or None
-        The parent node.
+        The parent node. Only a weak reference is stored, so a tree has no
+        reference cycles and a discarded tree is freed as soon as it is
+        dropped, without waiting for the cyclic garbage collector.
     children : List[MCTSNode]
         List of child nodes.
+    child_moves : List[chess.Move]
+        The move leading to each child, parallel to ``children``. With a
+        transposition table a child can be shared by several parents, so its
+        own ``move`` only records the move from the parent that created it.
     visits : int
         Number of times this node has been visited.
     wins : float
         Cumulative win score for this node.
     legal_moves : List[chess.Move]
-        All legal moves from this position.
+        All legal moves from this position (expanded moves first). Built on
+        access rather than stored per node.
     unexplored_moves : List[chess.Move]
         Legal moves that haven't been expanded yet.
     """
 
+    # Thousands of nodes live in a single search: slots drop the per-instance
+    # __dict__, shrinking each node and speeding up attribute access
+    __slots__ = (
+        "board",
+        "move",
+        "_parent",
+        "children",
+        "child_moves",
+        "visits",
+        "wins",
+        "unexplored_moves",
+        "_child_visits",
+        "_child_wins",
+        "_child_win_rates",
+        "_child_inv_sqrt_visits",
+        "_child_index",
+        "depth",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         board: chess.Board,
         move: Optional[chess.Move] = None,
         parent: Optional["MCTSNode"] = None,
     ):
-        self.board = board.copy()
+        self.board = board
         self.move = move  # The move that led to this position
         self.parent = parent
         self.children: List["MCTSNode"] = []
+        self.child_moves: List[chess.Move] = []
         self.visits = 0
         self.wins = 0.0
-        self.legal_moves = list(board.legal_moves)
-        random.shuffle(self.legal_moves)  # Randomize move order
-        self.unexplored_moves = self.legal_moves.copy()
+        self.unexplored_moves = list(board.legal_moves)
+        _shuffle(self.unexplored_moves)  # Randomize move order
+
+        # Per-child statistics stored as parallel arrays (structure of arrays)
+        # so UCB1 selection can be computed in one vectorized pass. A node can
+        # have at most one child per legal move, so no resizing is needed.
+        num_moves = len(self.unexplored_moves)
+        self._child_visits = np.zeros(num_moves, dtype=np.int64)
+        self._child_wins = np.zeros(num_moves, dtype=np.float64)
+        # Derived per-child UCB1 terms, refreshed whenever an edge's statistics
+        # change so selection does not recompute them for every sibling. An
+        # unvisited child has an infinite win rate, so it is explored first.
+        self._child_win_rates = np.full(num_moves, np.inf)
+        self._child_inv_sqrt_visits = np.zeros(num_moves, dtype=np.float64)
+        # Index of this node in its parent's child arrays
+        self._child_index = 0 if parent is None else len(parent.children)
 
         # Calculate depth from root
         self.depth = 0 if parent is None else parent.depth + 1
 
+    @property
+    def parent(self) -> Optional[MCTSNode]:
+        """
+        The parent node, dereferenced from the stored weak reference.
+
+        Returns
+        -------
+        MCTSNode or None
+            The parent node, or None for a root (or if the parent was freed).
+        """
+        return None if self._parent is None else self._parent()
+
+    @parent.setter
+    def parent(self, node: Optional[MCTSNode]) -> None:
+        self._parent = None if node is None else weakref.ref(node)
+
+    @property
+    def legal_moves(self) -> List[chess.Move]:
+        """
+        All legal moves from this position, expanded moves first.
+
+        Returns
+        -------
+        List[chess.Move]
+            The moves of the expanded children followed by the unexplored ones.
+        """
+        return self.child_moves + self.unexplored_moves
+
+    def collapse(self) -> None:
+        """
+        Drop all children, turning this node back into an unexpanded leaf.
+
+        The node keeps its own visit statistics, so the statistics of its
+        ancestors stay consistent; its moves can be expanded again later.
+        """
+        self.children = []
+        self.child_moves = []
+        self.unexplored_moves = list(self.board.legal_moves)
+        _shuffle(self.unexplored_moves)
+        self._child_visits[:] = 0
+        self._child_wins[:] = 0.0
+        self._child_win_rates[:] = np.inf
+        self._child_inv_sqrt_visits[:] = 0.0
+
     def is_fully_expanded(self) -> bool:
         """
         Check if all legal moves have been explored.
@@ -86,7 +243,9 @@ class MCTSNode:
         """
         return self.board.is_game_over()
 
-    def ucb1_value(self, exploration_constant: float) -> float:
+    def ucb1_value(
+        self, exploration_constant: float, log_parent_visits: Optional[float] = None
+    ) -> float:
         """
         Calculate UCB1 (Upper Confidence Bound 1) value for this node.
 
@@ -97,6 +256,11 @@ class MCTSNode:
         ----------
         exploration_constant : float
             The exploration parameter (typically sqrt(2)).
+        log_parent_visits : float, optional
+            Natural log of the visit count of the node this one is evaluated
+            from. Siblings share this value, so callers scoring several children
+            should compute it once and pass it in. Defaults to the log of the
+            parent's visit count; required for a node detached by tree reuse.
 
         Returns
         -------
@@ -111,11 +275,11 @@ class MCTSNode:
             return float("inf")
 
         exploitation = self.wins / self.visits
+        if log_parent_visits is None:
+            log_parent_visits = _log(self.parent.visits)
 
         # exploration term penalizes frequently visited nodes in order to favor less explored ones
-        exploration = exploration_constant * math.sqrt(
-            math.log(self.parent.visits) / self.visits
-        )
+        exploration = exploration_constant * _sqrt(log_parent_visits / self.visits)
         return exploitation + exploration
 
     def select_best_child(self, exploration_constant: float) -> "MCTSNode":
@@ -138,17 +302,53 @@ class MCTSNode:
         with high average win ratio. The second component corresponds to exploration; it is high for
         moves with few simulations.
         """
-        return max(
-            self.children, key=lambda child: child.ucb1_value(exploration_constant)
-        )
+        return self.children[self._best_child_index(exploration_constant)]
+
+    def _best_child_index(self, exploration_constant: float) -> int:
+        """
+        Return the index of the child with the highest UCB1 value.
 
-    def expand(self) -> "MCTSNode":
+        UCB1 is computed from the per-edge statistics stored on this node, which
+        stay correct when a child is shared through a transposition table. The
+        win rates and inverse square-root visit counts are cached per edge, so
+        one step only costs a multiply-add over the children.
+
+        Parameters
+        ----------
+        exploration_constant : float
+            The exploration parameter for UCB1 calculation.
+
+        Returns
+        -------
+        int
+            Index into ``children`` of the selected child.
+        """
+        n = len(self.children)
+
+        # UCB1 = w/n + c * sqrt(ln N / n) = w/n + (c * sqrt(ln N)) * (1 / sqrt(n)),
+        # where the parent term is shared by all siblings
+        exploration = exploration_constant * _sqrt(_log(self.visits))
+
+        # Unvisited children have an infinite win rate, so they are explored first
+        ucb = self._child_win_rates[:n] + exploration * self._child_inv_sqrt_visits[:n]
+        return int(ucb.argmax())
+
+    def expand(
+        self, transposition_table: Optional[Dict[Tuple, "MCTSNode"]] = None
+    ) -> "MCTSNode":
         """
         Expand this node by adding a new child.
 
         Creates a new child node for the next unexplored legal move.
         All legal moves are considered, but expansion stops at max_depth.
 
+        Parameters
+        ----------
+        transposition_table : dict, optional
+            Table of existing nodes keyed by ``_transposition_key``. If the new
+            position is already in the table, that node is linked as the child
+            instead of creating a new one, and new nodes are registered in it.
+
         Returns
         -------
         MCTSNode
@@ -158,23 +358,43 @@ class MCTSNode:
         if not self.unexplored_moves:
             return self
 
-        # Take the next unexplored move (all legal moves are considered)
-        move = self.unexplored_moves.pop(0)  # Create new board with the move applied
+        # Take the next unexplored move (all legal moves are considered).
+        # The list is already shuffled, so popping from the end is just as
+        # random as popping the front, and O(1) instead of O(n).
+        move = self.unexplored_moves.pop()
+
+        # Create new board with the move applied
         new_board = self.board.copy()
         new_board.push(move)
 
-        # Create new child node
-        child = MCTSNode(board=new_board, move=move, parent=self)
+        child = None
+        if transposition_table is not None:
+            key = _transposition_key(new_board)
+            child = transposition_table.get(key)
+
+        if child is None:
+            # Create new child node (it takes ownership of the copied board)
+            child = MCTSNode(board=new_board, move=move, parent=self)
+            if transposition_table is not None:
+                transposition_table[key] = child
+
         self.children.append(child)
+        self.child_moves.append(move)
 
         return child
 
-    def simulate(self, board_turn: bool, child_board: chess.Board) -> float:
+    @staticmethod
+    def simulate(
+        board_turn: bool,
+        child_board: chess.Board,
+        max_depth: int = 250,
+    ) -> float:
         """
         Run a random simulation from this position.
 
-        Uses the chess library's built-in draw detection for proper rule enforcement.
-        Plays random moves until the game ends naturally.
+        Plays random moves until the game ends or the depth limit is reached.
+        Only cheap terminal checks run per ply; the full game state is only
+        evaluated once the playout stops.
 
         Parameters
         ----------
@@ -182,6 +402,8 @@ class MCTSNode:
             The turn of the player to evaluate (True for White, False for Black).
         child_board : chess.Board
             The board position to simulate from.
+        max_depth : int, default=250
+            Maximum number of moves per side to play before stopping.
 
         Returns
         -------
@@ -190,30 +412,36 @@ class MCTSNode:
             1.0 means current player wins, 0.0 means current player loses,
             0.5 indicates a draw or neutral position.
         """
-        simulation_board = child_board.copy()
-
-        # Play until game ends - the chess library handles all draw conditions automatically
-        while not simulation_board.is_game_over():
-            # The chess library's is_game_over() method automatically checks:
-            # - Checkmate and stalemate
-            # - Fivefold repetition (via is_fivefold_repetition)
-            # - 75-move rule (via is_seventyfive_moves)
-            # - Insufficient material
-
-            legal_moves = list(simulation_board.legal_moves)
-            if not legal_moves:
+        # Rollouts never look at the move history, so skip copying the stack.
+        # This is much cheaper than a full copy (or resetting a scratch board
+        # from FEN), especially deep into a game.
+        simulation_board = child_board.copy(stack=False)
+
+        # Instead of the full is_game_over() every ply (which also scans the move
+        # stack for repetitions), only check what a random move can change:
+        # - Checkmate and stalemate: no legal moves left
+        # - 75-move rule: halfmove clock reaching 150 plies
+        # - Insufficient material: only possible right after a capture or a
+        #   promotion (underpromoting K+P vs K gives K+N or K+B vs K)
+        # Repetition draws are covered by the depth limit.
+        for _ in range(2 * max_depth):
+            move = _random_legal_move(simulation_board)
+            if move is None:
                 break
 
-            # Choose random move
-            move = random.choice(legal_moves)
+            changes_material = move.promotion or simulation_board.is_capture(move)
             simulation_board.push(move)
 
+            if simulation_board.halfmove_clock >= 150:
+                break
+            if changes_material and simulation_board.is_insufficient_material():
+                break
+
         # Evaluate the final position
-        return self._evaluate_position(board_turn, simulation_board)
+        return MCTSNode._evaluate_position(board_turn, simulation_board)
 
-    def _evaluate_position(
-        self, board_turn: bool, simulation_board: chess.Board
-    ) -> float:
+    @staticmethod
+    def _evaluate_position(board_turn: bool, simulation_board: chess.Board) -> float:
         """
         Evaluate the final position and return a score from current player's perspective.
 
@@ -235,15 +463,17 @@ class MCTSNode:
         if simulation_board.is_checkmate():
             # If it's checkmate, the player to move (in the simulated game) has lost
             return 0.0 if simulation_board.turn == board_turn else 1.0
-        elif (
-            simulation_board.is_stalemate()
-            or simulation_board.is_insufficient_material()
-        ):
-            return 0.5  # Draw
-        else:
-            return 0.5  # Neutral for unfinished games
 
-    def backpropagate(self, result: float):
+        # Stalemate, insufficient material and other draws score the same as an
+        # unfinished game, so there is no need to test for them separately
+        return 0.5
+
+    def backpropagate(
+        self,
+        result: float,
+        path: Optional[List[Tuple["MCTSNode", int]]] = None,
+        visits: int = 1,
+    ):
         """
         Backpropagate the simulation result up the tree.
 
@@ -253,14 +483,77 @@ class MCTSNode:
         Parameters
         ----------
         result : float
-            Simulation result from current node's perspective (0.0 to 1.0).
+            Simulation result from current node's perspective: between 0.0 and
+            ``visits``, as the sum of ``visits`` playout results.
+        path : list of (MCTSNode, int), optional
+            The ``(parent, child_index)`` edges from the root down to this node,
+            as returned by selection. Required when nodes are shared through a
+            transposition table; by default the parent links are followed.
+        visits : int, default=1
+            Number of playouts summed in ``result``.
         """
-        self.visits += 1
+        self.visits += visits
         self.wins += result
 
-        if self.parent:
+        # Walk the edges iteratively instead of recursing once per level
+        edges = reversed(path) if path is not None else self._parent_edges()
+        for parent, index in edges:
+            # Keep the parent's vectorized child statistics in sync
+            parent._child_visits[index] += visits
+            parent._child_wins[index] += result
+            parent._refresh_child_stats(index)
             # Flip the result for the parent (opponent's perspective)
-            self.parent.backpropagate(result=1.0 - result)
+            result = visits - result
+            parent.visits += visits
+            parent.wins += result
+
+    def _refresh_child_stats(self, index: int) -> None:
+        """
+        Update the cached UCB1 terms of one child after its statistics changed.
+
+        Parameters
+        ----------
+        index : int
+            Index of the child in ``children``.
+        """
+        visits = int(self._child_visits[index])
+        if visits > 0:
+            self._child_win_rates[index] = float(self._child_wins[index]) / visits
+            self._child_inv_sqrt_visits[index] = 1.0 / _sqrt(visits)
+        else:
+            self._child_win_rates[index] = np.inf
+            self._child_inv_sqrt_visits[index] = 0.0
+
+    def _parent_edges(self):
+        """
+        Yield the ``(parent, child_index)`` edges from this node up to the root.
+        """
+        node = self
+        while node.parent is not None:
+            yield node.parent, node._child_index
+            node = node.parent
+
+
+def _simulate_fen(task: Tuple[str, bool, int, int]) -> float:
+    """
+    Run a random playout in a worker process.
+
+    Parameters
+    ----------
+    task : tuple of (str, bool, int, int)
+        FEN of the position, turn of the player to evaluate, maximum playout
+        depth (moves per side) and random seed.
+
+    Returns
+    -------
+    float
+        Simulation result, as returned by ``MCTSNode.simulate``.
+    """
+    import chess
+
+    fen, board_turn, max_depth, seed = task
+    random.seed(seed)
+    return MCTSNode.simulate(board_turn, chess.Board(fen), max_depth)
 
 
 class ChessMCTS:
@@ -283,7 +576,7 @@ class ChessMCTS:
         Root node of the current search tree.
     """
 
-    def __init__(self, config: MCTSConfig = None):
+    def __init__(self, config: Optional[MCTSConfig] = None):
         """
         Initialize MCTS engine.
 
@@ -292,15 +585,60 @@ class ChessMCTS:
         config : MCTSConfig, optional
             Configuration parameters. If None, default config is used.
         """
+        if config is None:
+            config = MCTSConfig()
         self.config = config
         self.root: Optional[MCTSNode] = None
+        # Nodes keyed by position, shared across move orders (None when disabled)
+        self.transposition_table: Optional[Dict[Tuple, MCTSNode]] = (
+            {} if config.use_tt else None
+        )
+        # Worker pool for parallel rollouts, created on first use
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Number of distinct nodes in the tree, checked against max_tree_nodes
+        self._num_nodes = 0
+
+    def close(self) -> None:
+        """
+        Shut down the rollout worker pool, if one was started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def describe(self) -> str:
+        """
+        Describe the search configuration.
+
+        Returns
+        -------
+        str
+            Multi-line summary of the configuration, ready to print.
+        """
+        config = self.config
+        lines = [
+            "MCTS search config:",
+            "  Considering ALL legal moves",
+            f"  Target simulations: {config.num_simulations}",
+            f"  Max playout depth: {config.max_simulation_depth} moves per side",
+            f"  Exploration constant: {config.exploration_constant}",
+            f"  Rollouts per leaf: {config.rollouts_per_leaf}",
+            f"  Workers: {config.num_workers}",
+            f"  Transposition table: {'on' if config.use_tt else 'off'}",
+            f"  Max tree nodes: {config.max_tree_nodes or 'unlimited'}",
+        ]
+        return "\n".join(lines)
 
     def search(self, board: chess.Board) -> Tuple[chess.Move, Dict]:
         """
         Perform MCTS search and return the best move along with search statistics.
 
         Runs the four phases of MCTS (Selection, Expansion, Simulation, Backpropagation)
-        for the configured number of iterations.
+        for the configured number of iterations. If the current root (e.g. promoted
+        by ``advance_root``) already holds this position, its statistics are reused
+        and the new simulations are added on top of them. With
+        ``config.rollouts_per_leaf > 1``, each selected leaf is simulated several
+        times and the results are backpropagated together.
 
         Parameters
         ----------
@@ -311,7 +649,7 @@ class ChessMCTS:
         -------
         tuple of (chess.Move, dict)
             Best move found and dictionary containing search statistics:
-            - 'simulations_run': Number of simulations completed
+            - 'simulations_run': Number of simulations completed in this call
             - 'total_time': Total search time in seconds
             - 'simulations_per_second': Search speed
             - 'tree_size': Total nodes in search tree
@@ -321,51 +659,262 @@ class ChessMCTS:
             - 'selected_move_win_rate': Win rate of the selected move
             - 'tree_dict': Dictionary representation of the entire search tree
         """
-        self.root = MCTSNode(board)
-        start_time = time.time()
+        start_time = self._start_search(board)
         simulations_run = 0
-
-        print("Starting MCTS search with config:")
-        print("  Considering ALL legal moves")
-        print(f"  Target simulations: {self.config.num_simulations}")
-        print()
+        verbose = self.config.verbose
 
         while simulations_run < self.config.num_simulations:
+            rollouts = min(
+                self.config.rollouts_per_leaf,
+                self.config.num_simulations - simulations_run,
+            )
+
             # Selection: traverse tree using UCB1
             # NOTE: at the first move, no children exist yet (Expansion will handle this)
-            node = self._select(self.root)
+            node, path = self._select(self.root)
 
             # Expansion: add a new child if possible
             # node returned here is the child node
-            child_node = node.expand()
+            child_node = self._expand(node, path)
 
-            # Simulation: run random playout
-            result = child_node.simulate(
-                board_turn=board.turn, child_board=child_node.board
+            # Simulation: run random playouts, sharing one descent between them
+            result = 0.0
+            for _ in range(rollouts):
+                result += child_node.simulate(
+                    board_turn=board.turn,
+                    child_board=child_node.board,
+                    max_depth=self.config.max_simulation_depth,
+                )
+
+            # Backpropagation: update statistics with all playouts at once
+            child_node.backpropagate(result, path, rollouts)
+            self._limit_tree_size()
+
+            previous = simulations_run
+            simulations_run += rollouts
+
+            if verbose:
+                self._report_progress(previous, simulations_run, start_time)
+
+        return self._finish_search(simulations_run, start_time)
+
+    def search_batched(
+        self, board: chess.Board, vloss: int = 8
+    ) -> Tuple[chess.Move, Dict]:
+        """
+        Perform MCTS search, gathering several leaves per selection pass.
+
+        Each iteration selects up to ``vloss`` leaves using virtual loss: every
+        node on a selected path is temporarily counted as a visited loss, so the
+        following selections in the same batch diverge into other branches. The
+        batch of rollouts (``config.rollouts_per_leaf`` per leaf) is then
+        evaluated in one pass and backpropagated after the virtual loss is
+        reverted.
+
+        Parameters
+        ----------
+        board : chess.Board
+            Current chess position to search from.
+        vloss : int, default=8
+            Number of leaves gathered per iteration.
+
+        Returns
+        -------
+        tuple of (chess.Move, dict)
+            Best move found and search statistics, with the same keys as
+            returned by ``search``.
+        """
+        start_time = self._start_search(board)
+        simulations_run = 0
+        verbose = self.config.verbose
+
+        while simulations_run < self.config.num_simulations:
+            remaining = self.config.num_simulations - simulations_run
+            rollouts = min(self.config.rollouts_per_leaf, remaining)
+            batch_size = min(vloss, remaining // rollouts)
+
+            # Selection and Expansion with virtual loss applied along each path
+            leaves = []
+            paths = []
+            for _ in range(batch_size):
+                node, path = self._select(self.root)
+                child_node = self._expand(node, path)
+                self._apply_virtual_loss(child_node, path, rollouts)
+                leaves.append(child_node)
+                paths.append(path)
+
+            # Simulation: evaluate the whole batch of random playouts in one pass,
+            # then sum the playouts of each leaf
+            playout_leaves = [leaf for leaf in leaves for _ in range(rollouts)]
+            results = self._simulate_batch(playout_leaves, board.turn)
+            results = results.reshape(batch_size, rollouts).sum(axis=1)
+
+            # Backpropagation: revert the virtual loss, then apply real results
+            for leaf, path, result in zip(leaves, paths, results):
+                self._apply_virtual_loss(leaf, path, -rollouts)
+                leaf.backpropagate(float(result), path, rollouts)
+            # Prune only between batches, once no selected path is pending
+            self._limit_tree_size()
+
+            previous = simulations_run
+            simulations_run += batch_size * rollouts
+
+            if verbose:
+                self._report_progress(previous, simulations_run, start_time)
+
+        return self._finish_search(simulations_run, start_time)
+
+    def _start_search(self, board: chess.Board) -> float:
+        """
+        Prepare the tree for a search from the given position.
+
+        The existing tree is reused only if it is rooted at this exact position;
+        otherwise a fresh root is created.
+
+        Parameters
+        ----------
+        board : chess.Board
+            Position to search from.
+
+        Returns
+        -------
+        float
+            Start time of the search, as returned by ``time.time()``.
+        """
+        if self.root is None or self.root.board != board:
+            self._new_root(board)
+        return _time()
+
+    def _report_progress(
+        self, previous: int, simulations_run: int, start_time: float
+    ) -> None:
+        """
+        Print search progress each time another 100 simulations are completed.
+
+        Parameters
+        ----------
+        previous : int
+            Simulations completed before the last iteration.
+        simulations_run : int
+            Simulations completed so far.
+        start_time : float
+            Time at which the search started, as returned by ``time.time()``.
+        """
+        if simulations_run // 100 > previous // 100:
+            elapsed = _time() - start_time
+            print(f"Simulations: {simulations_run}, Elapsed: {elapsed:.2f}s")
+
+    def _simulate_batch(self, leaves: List[MCTSNode], board_turn: bool) -> np.ndarray:
+        """
+        Run one random playout from each leaf.
+
+        With ``config.num_workers > 1`` the playouts are distributed over a
+        process pool (leaf parallelization); otherwise they run serially.
+
+        Parameters
+        ----------
+        leaves : list of MCTSNode
+            Leaf nodes to simulate from.
+        board_turn : bool
+            The turn of the player to evaluate (True for White, False for Black).
+
+        Returns
+        -------
+        numpy.ndarray
+            Simulation results, one per leaf, in the same order.
+        """
+        max_depth = self.config.max_simulation_depth
+        num_workers = self.config.num_workers
+
+        if num_workers <= 1:
+            return np.fromiter(
+                (
+                    leaf.simulate(
+                        board_turn=board_turn,
+                        child_board=leaf.board,
+                        max_depth=max_depth,
+                    )
+                    for leaf in leaves
+                ),
+                dtype=np.float64,
+                count=len(leaves),
             )
 
-            # Backpropagation: update statistics
-            child_node.backpropagate(result)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=num_workers)
+
+        # Boards are sent as FEN; each task gets its own seed so workers do not
+        # replay the same random sequence
+        tasks = [
+            (leaf.board.fen(), board_turn, max_depth, random.getrandbits(64))
+            for leaf in leaves
+        ]
+        chunksize = max(1, len(tasks) // num_workers)
+        return np.fromiter(
+            self._executor.map(_simulate_fen, tasks, chunksize=chunksize),
+            dtype=np.float64,
+            count=len(tasks),
+        )
 
-            simulations_run += 1
+    def _apply_virtual_loss(
+        self, node: MCTSNode, path: List[Tuple[MCTSNode, int]], amount: int
+    ) -> None:
+        """
+        Add (or remove, with a negative amount) virtual loss along a path.
 
-            # Print progress every 100 simulations
-            if simulations_run % 100 == 0:
-                elapsed = time.time() - start_time
-                print(f"Simulations: {simulations_run}, Elapsed: {elapsed:.2f}s")
+        A virtual loss counts as a visit without any win score, lowering the
+        UCB1 value of every node from the leaf up to the root.
 
-        # Select best move based on visit count (most robust)
-        best_child = max(self.root.children, key=lambda child: child.visits)
-        best_move = best_child.move
+        Parameters
+        ----------
+        node : MCTSNode
+            Leaf node at the end of the selected path.
+        path : list of (MCTSNode, int)
+            The ``(parent, child_index)`` edges from the root down to the leaf.
+        amount : int
+            Number of virtual visits to add; use the negated value to revert.
+        """
+        node.visits += amount
+        for parent, index in path:
+            parent._child_visits[index] += amount
+            parent._refresh_child_stats(index)
+            parent.visits += amount
+
+    def _finish_search(
+        self, simulations_run: int, start_time: float
+    ) -> Tuple[chess.Move, Dict]:
+        """
+        Select the best root move and gather the search statistics.
+
+        Parameters
+        ----------
+        simulations_run : int
+            Number of simulations completed by the search.
+        start_time : float
+            Time at which the search started, as returned by ``time.time()``.
+
+        Returns
+        -------
+        tuple of (chess.Move, dict)
+            Best move found and dictionary containing search statistics.
+        """
+        # Select best move based on visit count (most robust). The per-edge
+        # counts are used: with a transposition table a child's own statistics
+        # also include visits that reached it through other parents.
+        root = self.root
+        edge_visits = root._child_visits[: len(root.children)]
+        best_index = int(edge_visits.argmax())
+        best_visits = int(edge_visits[best_index])
+        best_move = root.child_moves[best_index]
 
         # Calculate the win rate for the selected move
-        selected_move_win_rate = best_child.wins / best_child.visits
+        selected_move_win_rate = float(root._child_wins[best_index]) / best_visits
 
         # Construct tree dictionary representation
         tree_dict = self._tree_to_dict(self.root)
 
         # Gather statistics
-        total_time = time.time() - start_time
+        total_time = _time() - start_time
         stats = {
             "simulations_run": simulations_run,
             "total_time": total_time,
@@ -374,9 +923,7 @@ class ChessMCTS:
             else 0,
             "tree_size": self._count_nodes(self.root),
             "root_visits": self.root.visits,
-            "best_move_visits": max(
-                (child.visits for child in self.root.children), default=0
-            ),
+            "best_move_visits": best_visits,
             "children_count": len(self.root.children),
             "selected_move_win_rate": selected_move_win_rate,
             "tree_dict": tree_dict,
@@ -384,7 +931,126 @@ class ChessMCTS:
 
         return best_move, stats
 
-    def _select(self, node: MCTSNode) -> MCTSNode:
+    def advance_root(self, move: chess.Move) -> None:
+        """
+        Promote the child reached by the given move to be the new root.
+
+        Keeps the visit statistics of the played move's subtree so the next
+        search starts from a warm tree. If the move has not been expanded yet,
+        the tree is discarded and the next search starts from scratch.
+
+        Parameters
+        ----------
+        move : chess.Move
+            The move that was played from the current root position.
+        """
+        if self.root is not None:
+            for child, child_move in zip(self.root.children, self.root.child_moves):
+                if child_move == move:
+                    # Detach from the old root; with no strong references left,
+                    # the old root and the siblings' subtrees are freed here
+                    child.parent = None
+                    self.root = child
+                    self._rebuild_transposition_table()
+                    self._num_nodes = self._count_nodes(child)
+                    return
+
+        self.root = None
+        self._rebuild_transposition_table()
+        self._num_nodes = 0
+
+    def _rebuild_transposition_table(self) -> None:
+        """
+        Reset the transposition table to the nodes reachable from the root.
+
+        Positions that can no longer be reached after the root moves are
+        dropped, so their subtrees can be garbage collected.
+        """
+        if self.transposition_table is None:
+            return
+
+        table = {}
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            key = _transposition_key(node.board)
+            if key not in table:
+                table[key] = node
+                stack.extend(node.children)
+        self.transposition_table = table
+
+    def _new_root(self, board: chess.Board) -> None:
+        """
+        Start a fresh search tree rooted at the given position.
+
+        Parameters
+        ----------
+        board : chess.Board
+            Position for the new root; it is copied.
+        """
+        self.root = MCTSNode(board.copy())
+        self._num_nodes = 1
+        if self.transposition_table is not None:
+            self.transposition_table = {_transposition_key(self.root.board): self.root}
+
+    def _expand(self, node: MCTSNode, path: List[Tuple[MCTSNode, int]]) -> MCTSNode:
+        """
+        Expand a leaf and extend the selected path with the new edge.
+
+        Parameters
+        ----------
+        node : MCTSNode
+            Leaf returned by selection.
+        path : list of (MCTSNode, int)
+            Edges from the root to ``node``; the new edge is appended in place.
+
+        Returns
+        -------
+        MCTSNode
+            The new (or transposed) child, or ``node`` itself if it cannot be
+            expanded.
+        """
+        child = node.expand(self.transposition_table)
+        if child is not node:
+            path.append((node, len(node.children) - 1))
+            # Any node already in the tree has been visited (or holds a virtual
+            # loss), so an unvisited child was just created
+            if child.visits == 0:
+                self._num_nodes += 1
+        return child
+
+    def _limit_tree_size(self) -> None:
+        """
+        Prune the tree if it has grown past ``config.max_tree_nodes``.
+
+        The subtrees of the least visited root children are collapsed (the
+        children themselves and their statistics are kept) until the tree is
+        back to three quarters of the limit, so pruning does not run again
+        after every expansion.
+        """
+        max_nodes = self.config.max_tree_nodes
+        if max_nodes is None or self._num_nodes <= max_nodes:
+            return
+
+        target = max_nodes * 3 // 4
+        root = self.root
+        # Rank root moves by their edge visits (see _finish_search)
+        edge_visits = root._child_visits[: len(root.children)]
+        for index in edge_visits.argsort(kind="stable"):
+            if self._num_nodes <= target:
+                break
+            child = root.children[index]
+            if child.children:
+                self._num_nodes -= self._count_nodes(child) - 1
+                child.collapse()
+
+        if self.transposition_table is not None:
+            # Shared nodes may still be reachable through other branches, so
+            # recount the remaining tree after dropping unreachable positions
+            self._rebuild_transposition_table()
+            self._num_nodes = len(self.transposition_table)
+
+    def _select(self, node: MCTSNode) -> Tuple[MCTSNode, List[Tuple[MCTSNode, int]]]:
         """
         Select a leaf node using UCB1.
 
@@ -398,21 +1064,26 @@ class ChessMCTS:
 
         Returns
         -------
-        MCTSNode
-            A leaf node (either terminal or not fully expanded).
+        tuple of (MCTSNode, list of (MCTSNode, int))
+            A leaf node (either terminal or not fully expanded) and the
+            ``(parent, child_index)`` edges taken to reach it.
         """
         # NOTE: this will go down until a leaf node (end game) is found
         # (it enters the "while" loop only after all legal moves from that node are visited)
         # After that, Expansion will handle adding a new child.
+        path = []
         while (not node.is_terminal()) and node.is_fully_expanded():
-            node = node.select_best_child(self.config.exploration_constant)
-        return node
+            index = node._best_child_index(self.config.exploration_constant)
+            path.append((node, index))
+            node = node.children[index]
+        return node, path
 
     def _count_nodes(self, node: MCTSNode) -> int:
         """
         Count total nodes in the tree.
 
-        Recursively counts all nodes in the subtree rooted at the given node.
+        Counts all distinct nodes in the subtree rooted at the given node
+        (nodes shared through the transposition table are counted once).
 
         Parameters
         ----------
@@ -424,12 +1095,17 @@ class ChessMCTS:
         int
             Total number of nodes in the subtree.
         """
-        count = 1
-        for child in node.children:
-            count += self._count_nodes(child)
-        return count
-
-    def _tree_to_dict(self, node: MCTSNode) -> Dict:
+        # Explicit stack avoids recursion overhead and recursion limits on deep trees
+        seen = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if id(current) not in seen:
+                seen.add(id(current))
+                stack.extend(current.children)
+        return len(seen)
+
+    def _tree_to_dict(self, node: MCTSNode, move: Optional[chess.Move] = None) -> Dict:
         """
         Convert the MCTS tree to a dictionary representation.
 
@@ -440,6 +1116,9 @@ class ChessMCTS:
         ----------
         node : MCTSNode
             The root node of the subtree to convert.
+        move : chess.Move, optional
+            The move leading to ``node`` from the parent being converted.
+            Defaults to the node's own ``move``.
 
         Returns
         -------
@@ -452,13 +1131,18 @@ class ChessMCTS:
             - 'children': List of child dictionaries with same structure
         """
         # Convert children recursively
-        children = [self._tree_to_dict(child) for child in node.children]
+        children = [
+            self._tree_to_dict(child, child_move)
+            for child, child_move in zip(node.children, node.child_moves)
+        ]
+        if move is None:
+            move = node.move
 
         # Calculate win rate
         win_rate = node.wins / node.visits if node.visits > 0 else 0.0
 
         return {
-            "move": str(node.move) if node.move else None,
+            "move": str(move) if move else None,
             "visits": node.visits,
             "wins": node.wins,
             "win_rate": win_rate,
@@ -485,16 +1169,24 @@ class ChessMCTS:
         print("Move                 Visits    Win Rate    UCB1")
         print("-" * 50)
 
-        # Sort children by visit count
-        sorted_children = sorted(
-            self.root.children, key=lambda child: child.visits, reverse=True
-        )
-
-        for i, child in enumerate(sorted_children[:top_moves]):
-            win_rate = child.wins / child.visits if child.visits > 0 else 0
-            ucb1 = child.ucb1_value(self.config.exploration_constant)
+        # Sort root moves by visit count, using the per-edge statistics (with a
+        # transposition table a child's own counts include other parents)
+        root = self.root
+        n = len(root.children)
+        edge_visits = root._child_visits[:n]
+        order = sorted(range(n), key=lambda i: edge_visits[i], reverse=True)
+
+        # UCB1 from the cached per-edge terms, as used by selection
+        exploration = self.config.exploration_constant * _sqrt(_log(root.visits))
+
+        for i in order[:top_moves]:
+            visits = int(edge_visits[i])
+            win_rate = float(root._child_wins[i]) / visits if visits > 0 else 0
+            ucb1 = float(
+                root._child_win_rates[i] + exploration * root._child_inv_sqrt_visits[i]
+            )
             ucb1_str = f"{ucb1:.3f}" if ucb1 != float("inf") else "inf"
 
             print(
-                f"{str(child.move):<15} {child.visits:>8} {win_rate:>10.3f} {ucb1_str:>8}"
+                f"{str(root.child_moves[i]):<15} {visits:>8} {win_rate:>10.3f} {ucb1_str:>8}"
             )